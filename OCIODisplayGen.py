@@ -5,6 +5,8 @@
 # library to create the OCIO config
 
 import argparse
+import copy
+import functools
 import hashlib
 import hmac
 import ntpath
@@ -22,6 +24,14 @@ import numpy.typing as npt
 import PyOpenColorIO as OCIO
 import yaml  # type: ignore[import]
 
+# libyaml's C parser when PyYAML was built with it — same safe schema,
+# several times faster than the pure-Python SafeLoader.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+YAML_BACKEND = "libyaml" if YamlLoader.__name__ == "CSafeLoader" else "pure Python"
+
 
 def derive_reference_spaces(ocio_config: "OCIO.Config") -> Tuple[str, str]:
     """
@@ -123,6 +133,11 @@ ACES2_BASE_CONFIG_URI = "ocio://studio-config-v4.0.0_aces-v2.0_ocio-v2.5"
 WHITE_POINT_POLICIES = ("adapted", "absolute")
 
 
+# Row order of DisplayCharacterization.primaries, and the keys of the
+# measurements artifact's colorimetry.primaries mapping.
+PRIMARY_COLORS = ("red", "green", "blue")
+
+
 def unknown_policy_message(kind: str, value: str, valid: Tuple[str, ...]) -> str:
     """Shared policy-enum failure message, so the validator's warnings
     and the transform builders' errors cannot drift."""
@@ -134,9 +149,9 @@ class DisplayCharacterization:
 
     def __init__(self, name: str):
         self.name = name
-        self.primaries: Dict[
-            str, Tuple[float, float]
-        ] = {}  # Measured RGB primaries (xy coordinates)
+        # Measured RGB primaries (xy coordinates), one row per
+        # PRIMARY_COLORS entry
+        self.primaries: npt.NDArray[np.float64] = np.zeros((3, 2), dtype=np.float64)
         self.white_point: Optional[Tuple[float, float]] = (
             None  # Measured white point (xy coordinates)
         )
@@ -153,10 +168,28 @@ class DisplayCharacterization:
         self.processor_processing_disabled: Optional[bool] = None
 
 
-def _matrix_transform(matrix: npt.NDArray[np.floating[Any]]) -> OCIO.MatrixTransform:
-    """4x4 row-major matrix as an OCIO MatrixTransform."""
+# Row-major slots of OCIO's 16-float matrix holding the RGB 3x3 block;
+# the rest is alpha passthrough.
+_OCIO_MATRIX_RGB_SLOTS = [0, 1, 2, 4, 5, 6, 8, 9, 10]
+
+
+def _to_ocio_matrix(matrix_3x3: npt.NDArray[np.floating[Any]]) -> List[float]:
+    """3x3 row-major matrix in OCIO's 16-float layout: the 3x3 block
+    written straight into its slots, alpha passed through."""
+    out = np.zeros(16, dtype=np.float64)
+    out[_OCIO_MATRIX_RGB_SLOTS] = matrix_3x3.ravel()
+    out[15] = 1.0
+    return cast(List[float], out.tolist())
+
+
+def _matrix_transform(
+    matrix_3x3: npt.NDArray[np.floating[Any]],
+) -> OCIO.MatrixTransform:
+    """3x3 row-major matrix as an OCIO MatrixTransform. The binding
+    converts a 16-float list element by element, so it gets a plain
+    list: an ndarray would be iterated as boxed NumPy scalars."""
     transform = OCIO.MatrixTransform()
-    transform.setMatrix(matrix.flatten().tolist())
+    transform.setMatrix(_to_ocio_matrix(matrix_3x3))
     return transform
 
 
@@ -179,13 +212,8 @@ def _measured_wall_gamut(
     white_point = characterization.white_point
     if white_point is None:
         raise ValueError("Characterization has no measured white point")
-    return (
-        characterization.peak_luminance,
-        characterization.primaries["red"],
-        characterization.primaries["green"],
-        characterization.primaries["blue"],
-        white_point,
-    )
+    red, green, blue = ((float(x), float(y)) for x, y in characterization.primaries)
+    return (characterization.peak_luminance, red, green, blue, white_point)
 
 
 def _describe_gamut(
@@ -211,12 +239,36 @@ def describe_processing_state(disabled: Optional[bool]) -> str:
     return "disabled" if disabled else "NOT disabled"
 
 
+@functools.lru_cache(maxsize=16)
+def _derived_xyz_to_rgb_matrix(
+    primaries_xy: Tuple[Tuple[float, float], ...],
+    white_xy: Tuple[float, float],
+) -> npt.NDArray[np.float64]:
+    """
+    XYZ → RGB for an RGB space given by its xy primaries and white, via
+    the closed-form normalized primary matrix (SMPTE RP 177): primaries
+    as XYZ columns P, channel scales S solving P @ S = white XYZ (Y = 1),
+    NPM = P * S, inverted.
+
+    Keyed on plain tuples so repeated builds for one wall reuse the
+    solve; the cached result is read-only.
+    """
+    primaries = np.array(primaries_xy, dtype=np.float64)
+    wx, wy = white_xy
+    xyz = np.column_stack([primaries, 1.0 - primaries.sum(axis=1)]).T
+    white_xyz = np.array([wx / wy, 1.0, (1.0 - wx - wy) / wy])
+    scale = np.linalg.solve(xyz, white_xyz)
+    matrix = np.linalg.inv(xyz * scale)
+    matrix.setflags(write=False)
+    return matrix
+
+
 def create_display_xyz_to_native_matrix(
     characterization: DisplayCharacterization,
     chromatic_adaptation_transform: str = "CAT02",
 ) -> npt.NDArray[np.float64]:
     """
-    Build the 4x4 matrix from display-reference CIE XYZ (D65-adapted) to
+    Build the 3x3 matrix from display-reference CIE XYZ (D65-adapted) to
     the wall's native RGB, per the characterization's white point policy
     (§spec:white-point).
 
@@ -233,10 +285,11 @@ def create_display_xyz_to_native_matrix(
             (adapted policy only)
 
     Returns:
-        4x4 matrix for an OCIO MatrixTransform (row-major)
+        3x3 row-major matrix; _matrix_transform pads it for OCIO
 
     Raises:
-        ValueError: For unknown white point policies.
+        ValueError: For unknown white point policies or a missing
+            measured white point.
     """
     white_point_policy = characterization.white_point_policy
     if white_point_policy not in WHITE_POINT_POLICIES:
@@ -246,22 +299,15 @@ def create_display_xyz_to_native_matrix(
             )
         )
 
-    primaries = np.array(
-        [
-            characterization.primaries["red"],
-            characterization.primaries["green"],
-            characterization.primaries["blue"],
-        ],
-        dtype=np.float64,
-    )
-    white_xy = np.asarray(characterization.white_point, dtype=np.float64)
+    white_point = characterization.white_point
+    if white_point is None:
+        raise ValueError("Characterization has no measured white point")
+    white_xy = np.asarray(white_point, dtype=np.float64)
 
-    wall_space = colour.RGB_Colourspace(
-        characterization.name, primaries, white_xy, "Wall White"
+    matrix_3x3 = _derived_xyz_to_rgb_matrix(
+        tuple((float(x), float(y)) for x, y in characterization.primaries),
+        (float(white_xy[0]), float(white_xy[1])),
     )
-    wall_space.use_derived_transformation_matrices()
-
-    matrix_3x3 = wall_space.matrix_XYZ_to_RGB
     if white_point_policy == "adapted":
         cat_matrix = colour.adaptation.matrix_chromatic_adaptation_VonKries(
             colour.xy_to_XYZ(np.array(D65_WHITE_XY)),
@@ -270,9 +316,8 @@ def create_display_xyz_to_native_matrix(
         )
         matrix_3x3 = matrix_3x3 @ cat_matrix
 
-    matrix_4x4 = np.identity(4)
-    matrix_4x4[:3, :3] = matrix_3x3
-    return matrix_4x4
+    # A private copy: the derived matrix is shared through the cache.
+    return np.array(matrix_3x3, dtype=np.float64)
 
 
 def create_display_colorspace_from_characterization(
@@ -285,8 +330,8 @@ def create_display_colorspace_from_characterization(
     The colorspace is display-referred: its from_display_reference
     transform maps CIE XYZ (D65-adapted, 1.0 = 100 cd/m²) to the wall's
     encoded native RGB. Pipeline: XYZ→native matrix (white point policy
-    applied), absolute luminance scale, hard clip, inverse processor
-    EOTF. It holds only measured colorimetry — exact within gamut,
+    applied, absolute luminance scale fused in), hard clip, inverse
+    processor EOTF. It holds only measured colorimetry — exact within gamut,
     hard-clipped outside. The chosen policy is recorded in the
     colorspace description.
 
@@ -362,25 +407,27 @@ def create_display_colorspace_from_characterization(
     # Stage 1: XYZ (D65-adapted) → native RGB, per white point policy.
     # Adapted: native (1,1,1) = wall white at 100 cd/m² (Y = 1.0).
     # Absolute: no adaptation; D65 content white lands off the wall's
-    # neutral axis and may single-channel clip at stage 3.
-    matrix_4x4 = create_display_xyz_to_native_matrix(
+    # neutral axis and may single-channel clip at stage 2.
+    xyz_to_native = create_display_xyz_to_native_matrix(
         characterization, chromatic_adaptation_transform
     )
-    group.appendTransform(_matrix_transform(matrix_4x4))
-
     if eotf_type == "GAMMA":
-        # Stage 2: absolute luminance scale — RGB 1.0 = measured peak.
-        # Kept as a distinct stage for auditability.
-        scale = REFERENCE_LUMINANCE / peak
-        group.appendTransform(_matrix_transform(np.diag([scale] * 3 + [1.0])))
+        # Absolute luminance scale — RGB 1.0 = measured peak — fused
+        # into the stage 1 matrix, which makes it the VP view's drive
+        # space matrix. OCIO's optimizer would collapse two adjacent
+        # matrices, but only at some optimization levels; fusing here
+        # guarantees one matrix op regardless.
+        matrix = _drive_space_matrix(characterization, xyz_to_native)
         clip_max = 1.0
     else:
         # PQ is absolute (encodes nits directly): omit the luminance
         # scale and clip at the measured peak instead, so the encoding
         # stays exact and out-of-range values clip at the wall's peak.
+        matrix = xyz_to_native
         clip_max = peak / REFERENCE_LUMINANCE
+    group.appendTransform(_matrix_transform(matrix))
 
-    # Stage 3: hard clip. The display colorspace is exact within gamut
+    # Stage 2: hard clip. The display colorspace is exact within gamut
     # and hard-clips outside; gamut handling belongs to view transforms.
     range_transform = OCIO.RangeTransform()
     range_transform.setMinInValue(0.0)
@@ -389,7 +436,7 @@ def create_display_colorspace_from_characterization(
     range_transform.setMaxOutValue(clip_max)
     group.appendTransform(range_transform)
 
-    # Stage 4: inverse processor EOTF (linear → encoded).
+    # Stage 3: inverse processor EOTF (linear → encoded).
     if eotf_type == "PQ":
         pq_transform = OCIO.BuiltinTransform("CURVE - LINEAR_to_ST-2084")
         pq_transform.setDirection(OCIO.TRANSFORM_DIR_FORWARD)
@@ -432,10 +479,10 @@ def _shoulder_overflow_transform() -> OCIO.LogCameraTransform:
 
 def _drive_space_matrix(
     characterization: DisplayCharacterization,
-    chromatic_adaptation_transform: str,
+    xyz_to_native: npt.NDArray[np.float64],
 ) -> npt.NDArray[np.float64]:
     """Display-reference XYZ → wall drive space, where 1.0 is full
-    drive.
+    drive, from the characterization's XYZ→native policy matrix.
 
     The VP Radiometric view and the probe predictor's inverse are the
     same matrix by construction: predictions describe the rendering the
@@ -444,10 +491,8 @@ def _drive_space_matrix(
     landing on the measured gamut boundary.
     """
     return np.asarray(
-        np.diag([REFERENCE_LUMINANCE / characterization.peak_luminance] * 3 + [1.0])
-        @ create_display_xyz_to_native_matrix(
-            characterization, chromatic_adaptation_transform
-        ),
+        np.diag([REFERENCE_LUMINANCE / characterization.peak_luminance] * 3)
+        @ xyz_to_native,
         dtype=np.float64,
     )
 
@@ -485,6 +530,25 @@ def create_vp_radiometric_view_transform(
         ValueError: For unknown overflow policies or a missing measured
             white point.
     """
+    return _build_vp_radiometric_view_transform(
+        characterization,
+        nits_anchor,
+        overflow_policy,
+        create_display_xyz_to_native_matrix(
+            characterization, chromatic_adaptation_transform
+        ),
+    )
+
+
+def _build_vp_radiometric_view_transform(
+    characterization: DisplayCharacterization,
+    nits_anchor: float,
+    overflow_policy: str,
+    xyz_to_native: npt.NDArray[np.float64],
+) -> OCIO.ViewTransform:
+    """VP Radiometric view around an already-derived policy matrix.
+    Takes no CAT of its own, so the matrix is the only source of the
+    drive space; see create_vp_radiometric_view_transform."""
     if overflow_policy not in OVERFLOW_POLICIES:
         raise ValueError(
             unknown_policy_message(
@@ -524,7 +588,7 @@ def create_vp_radiometric_view_transform(
 
     # Stage 1: nits anchor — scene-linear 1.0 → anchor cd/m² in
     # display-linear units (1.0 = REFERENCE_LUMINANCE).
-    anchor_matrix = np.diag([nits_anchor / REFERENCE_LUMINANCE] * 3 + [1.0])
+    anchor_matrix = np.diag([nits_anchor / REFERENCE_LUMINANCE] * 3)
     group.appendTransform(_matrix_transform(anchor_matrix))
 
     # Stage 2: ACES 2.0 gamut compression sandwich in JMh, limited to
@@ -551,7 +615,7 @@ def create_vp_radiometric_view_transform(
     # Stage 4: into drive space — wall native RGB where 1.0 = full
     # drive. Reuses the display colorspace's exact policy matrix so the
     # view and colorspace compose transparently.
-    drive = _drive_space_matrix(characterization, chromatic_adaptation_transform)
+    drive = _drive_space_matrix(characterization, xyz_to_native)
     group.appendTransform(_matrix_transform(drive))
 
     # Stage 5: above-peak overflow policy, per channel in drive space.
@@ -604,6 +668,20 @@ def create_aces2_view_transform(
     Raises:
         ValueError: For a missing measured white point.
     """
+    return _build_aces2_view_transform(
+        characterization,
+        create_display_xyz_to_native_matrix(
+            characterization, chromatic_adaptation_transform
+        ),
+    )
+
+
+def _build_aces2_view_transform(
+    characterization: DisplayCharacterization,
+    xyz_to_native: npt.NDArray[np.float64],
+) -> OCIO.ViewTransform:
+    """ACES 2.0 view around an already-derived policy matrix; see
+    create_aces2_view_transform."""
     peak, red, green, blue, white_point = _measured_wall_gamut(characterization)
 
     vt = OCIO.ViewTransform(OCIO.REFERENCE_SPACE_SCENE)
@@ -633,11 +711,7 @@ def create_aces2_view_transform(
     # drive-space sandwich, without the 100/peak factor: the output
     # transform's display-linear already shares the display
     # reference's 1.0 = 100 cd/m² anchor).
-    native_to_xyz = np.linalg.inv(
-        create_display_xyz_to_native_matrix(
-            characterization, chromatic_adaptation_transform
-        )
-    )
+    native_to_xyz = np.linalg.inv(xyz_to_native)
     group.appendTransform(_matrix_transform(native_to_xyz))
 
     vt.setTransform(group, OCIO.VIEWTRANSFORM_DIR_FROM_REFERENCE)
@@ -694,15 +768,14 @@ def register_display(
             f"({ACES2_BASE_CONFIG_URI})"
         )
 
-    vp_view_transform = create_vp_radiometric_view_transform(
-        characterization,
-        nits_anchor,
-        overflow_policy,
-        chromatic_adaptation_transform,
-    )
-    aces2_view_transform = create_aces2_view_transform(
+    # Both views sandwich the same policy matrix: derive it once.
+    xyz_to_native = create_display_xyz_to_native_matrix(
         characterization, chromatic_adaptation_transform
     )
+    vp_view_transform = _build_vp_radiometric_view_transform(
+        characterization, nits_anchor, overflow_policy, xyz_to_native
+    )
+    aces2_view_transform = _build_aces2_view_transform(characterization, xyz_to_native)
     config.addColorSpace(colorspace)
     config.addViewTransform(vp_view_transform)
     config.addViewTransform(aces2_view_transform)
@@ -892,7 +965,7 @@ def parse_yaml_mapping(data: bytes, path: str, role: str) -> Dict[str, Any]:
         ValueError: For invalid YAML or content that is not a mapping.
     """
     try:
-        parsed = yaml.safe_load(data)
+        parsed = yaml.load(data, Loader=YamlLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"{role} '{path}' is not valid YAML: {e}") from e
     if not isinstance(parsed, dict):
@@ -1002,6 +1075,18 @@ def load_inputs(
     return manifest, measurements, provenance
 
 
+def measured_contrast_ratio(peak_luminance: float, black_level: float) -> float:
+    """
+    Peak over black, shared by validation and characterization so the
+    guarded division lives in one place. Infinite for a non-positive
+    black level: non-strict validation lets a zero black level through
+    with a warning.
+    """
+    if black_level > 0:
+        return float(peak_luminance) / float(black_level)
+    return float("inf")
+
+
 def create_characterization(
     manifest: Dict[str, Any], measurements: Dict[str, Any]
 ) -> DisplayCharacterization:
@@ -1027,23 +1112,16 @@ def create_characterization(
     # Measured colorimetry from the artifact
     colorimetry = measurements["colorimetry"]
     primaries = colorimetry["primaries"]
-    char.primaries = {
-        "red": tuple(primaries["red"]),
-        "green": tuple(primaries["green"]),
-        "blue": tuple(primaries["blue"]),
-    }
+    char.primaries = np.array(
+        [primaries[color] for color in PRIMARY_COLORS], dtype=np.float64
+    )
     char.white_point = tuple(colorimetry["white_point"])
 
     # Measured luminance from the artifact
     luminance = measurements["luminance"]
     char.black_level = luminance["black_level"]
     char.peak_luminance = luminance["peak_luminance"]
-    # Guard the division: non-strict validation lets a zero black level
-    # through with a warning.
-    if char.black_level > 0:
-        char.contrast_ratio = char.peak_luminance / char.black_level
-    else:
-        char.contrast_ratio = float("inf")
+    char.contrast_ratio = measured_contrast_ratio(char.peak_luminance, char.black_level)
 
     # Intended signal contract (§spec:signal-contract) is a decision:
     # the lockdown state the config is valid for, distinct from the
@@ -1070,38 +1148,53 @@ def create_characterization(
     return char
 
 
+# Validation settings: defaults, overridden key by key from an optional
+# file in the working directory.
+VALIDATION_SETTINGS_FILE = "validation_settings.yaml"
+DEFAULT_VALIDATION_SETTINGS: Dict[str, Any] = {
+    "check_primaries": True,
+    "check_white_point": True,
+    "check_luminance": True,
+    "check_contrast": True,
+    "check_processor_state": True,
+    "min_contrast_ratio": 100,
+    "max_contrast_ratio": 10000,
+    "warn_on_validation_failure": True,
+    "strict_mode": False,
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_validation_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parsed validation settings file. Keyed on the file's stat as well
+    as its path, so batch validation parses it once and an edit is
+    still picked up. Callers must not mutate the result.
+
+    Read as bytes, like the show manifest and measurements artifact:
+    the C loader detects the encoding itself, skipping text-mode IO."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return yaml.load(data, Loader=YamlLoader)
+
+
 def load_validation_settings() -> Dict[str, Any]:
     """Load validation settings from external file."""
 
-    # Default validation settings
-    default_validation: Dict[str, Any] = {
-        "check_primaries": True,
-        "check_white_point": True,
-        "check_luminance": True,
-        "check_contrast": True,
-        "check_processor_state": True,
-        "min_contrast_ratio": 100,
-        "max_contrast_ratio": 10000,
-        "warn_on_validation_failure": True,
-        "strict_mode": False,
-    }
-
     # Load external validation settings file
-    validation_file = "validation_settings.yaml"
+    validation_file = VALIDATION_SETTINGS_FILE
     external_validation: Dict[str, Any] = {}
 
     if os.path.exists(validation_file):
         try:
-            with open(validation_file, "r", encoding="utf-8") as f:
-                loaded_data = yaml.safe_load(f)
-                if isinstance(loaded_data, dict):
-                    external_validation = cast(Dict[str, Any], loaded_data)
-                else:
-                    print(
-                        "⚠️  Warning: Validation settings file contains "
-                        "invalid data type"
-                    )
-                    print("   Using default validation settings")
+            stat = os.stat(validation_file)
+            loaded_data = _load_validation_file(
+                os.path.abspath(validation_file), stat.st_mtime_ns, stat.st_size
+            )
+            if isinstance(loaded_data, dict):
+                external_validation = cast(Dict[str, Any], loaded_data)
+            else:
+                print("⚠️  Warning: Validation settings file contains invalid data type")
+                print("   Using default validation settings")
             print(f"✓ Loaded validation settings from '{validation_file}'")
         except yaml.YAMLError as e:
             print(f"⚠️  Warning: Error parsing validation settings file: {e}")
@@ -1111,7 +1204,7 @@ def load_validation_settings() -> Dict[str, Any]:
         print("   Using default validation settings")
 
     # Merge settings: external file -> defaults
-    validation_settings: Dict[str, Any] = default_validation.copy()
+    validation_settings: Dict[str, Any] = DEFAULT_VALIDATION_SETTINGS.copy()
     validation_settings.update(external_validation)
 
     return validation_settings
@@ -1183,6 +1276,26 @@ def validate_manifest_data(
     return True
 
 
+def white_point_cct_duv(xy: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """
+    CCT (K) and duv of xy chromaticities via CIE 1960 UCS uv (Ohno 2013).
+
+    Takes one (x, y) pair or an (N, 2) array: colour-science broadcasts,
+    so a batch of white points costs one call rather than N iterative
+    table searches. Returns shape (..., 2) as (CCT, duv).
+    """
+    uv = colour.xy_to_UCS_uv(np.asarray(xy, dtype=np.float64))
+    return np.asarray(colour.uv_to_CCT(uv, method="Ohno 2013"), dtype=np.float64)
+
+
+@functools.lru_cache(maxsize=64)
+def _wp_cct_duv(x: float, y: float) -> Tuple[float, float]:
+    """white_point_cct_duv for a single white point, memoized: the
+    Ohno 2013 search is the slowest step of validation."""
+    cct, duv = white_point_cct_duv((x, y))
+    return float(cct), float(duv)
+
+
 def validate_measurements_data(
     measurements: Dict[str, Any],
     validation_config: Dict[str, Any],
@@ -1199,10 +1312,18 @@ def validate_measurements_data(
             "Validating display primaries: basic chromaticity range check "
             "(not a true spectral locus test)..."
         )
-        for color, coords in measurements["colorimetry"]["primaries"].items():
-            x, y = coords
-            # Basic range check
-            if not (0.0 <= x <= 1.0 and 0.0 <= y <= 1.0 and x + y <= 1.0):
+        primaries = measurements["colorimetry"]["primaries"]
+        coords = np.array(
+            [primaries[color] for color in PRIMARY_COLORS], dtype=np.float64
+        )
+        # Basic range check, all three primaries at once
+        in_triangle = (
+            (coords >= 0.0).all(axis=1)
+            & (coords <= 1.0).all(axis=1)
+            & (coords.sum(axis=1) <= 1.0)
+        )
+        for color, (x, y), valid in zip(PRIMARY_COLORS, coords, in_triangle):
+            if not valid:
                 message = (
                     f"❌ Warning: {color} primary ({x}, {y}) is outside the "
                     f"valid xy chromaticity triangle (0 ≤ x ≤ 1, 0 ≤ y ≤ 1, "
@@ -1236,12 +1357,8 @@ def validate_measurements_data(
 
         # Check duv deviation from Planckian locus (using CIE 1960 UCS uv)
         try:
-            # Convert xy to CIE 1960 UCS uv coordinates
-            xy_coords = np.array([x, y])
-            uv_coords = colour.xy_to_UCS_uv(xy_coords)
-
             # Calculate CCT and duv
-            CCT, duv = colour.uv_to_CCT(uv_coords, method="Ohno 2013")
+            CCT, duv = _wp_cct_duv(float(x), float(y))
 
             # Check CCT range
             min_cct = validation_config.get("min_white_point_temp", 4000)
@@ -1287,11 +1404,11 @@ def validate_measurements_data(
             print(f"⚠️  Warning: Could not calculate duv deviation: {e}")
             print("   Skipping duv validation")
 
+    black_level = measurements["luminance"]["black_level"]
+    peak_luminance = measurements["luminance"]["peak_luminance"]
+
     # Check luminance values
     if validation_config.get("check_luminance", True):
-        black_level = measurements["luminance"]["black_level"]
-        peak_luminance = measurements["luminance"]["peak_luminance"]
-
         if black_level <= 0:
             # A measured black level is never exactly zero; zero usually
             # means the instrument floored or the field was guessed.
@@ -1323,10 +1440,8 @@ def validate_measurements_data(
 
     # Check contrast ratio (skipped for non-positive black level, which
     # the luminance check above already reported).
-    black_level = float(measurements["luminance"]["black_level"])
-    if validation_config.get("check_contrast", True) and black_level > 0:
-        peak_luminance = float(measurements["luminance"]["peak_luminance"])
-        contrast_ratio = peak_luminance / black_level
+    contrast_ratio = measured_contrast_ratio(peak_luminance, black_level)
+    if validation_config.get("check_contrast", True) and np.isfinite(contrast_ratio):
         min_contrast = validation_config.get("min_contrast_ratio", 100)
         max_contrast = validation_config.get("max_contrast_ratio", 10000)
 
@@ -1349,7 +1464,6 @@ def validate_measurements_data(
     # prefers gamma 2.4 on SDR-only links. Strict mode escalates
     # measurement-plausibility failures, not encoding preferences.
     if validation_config.get("warn_on_sdr_eotf", True):
-        peak_luminance = measurements["luminance"]["peak_luminance"]
         eotf_type = measurements.get("processor_state", {}).get("eotf", {}).get("type")
         sdr_threshold = validation_config.get("sdr_warning_threshold", 400.0)
 
@@ -1379,14 +1493,22 @@ def validate_measurements_data(
     return True
 
 
-def validate_inputs(manifest: Dict[str, Any], measurements: Dict[str, Any]) -> bool:
+def validate_inputs(
+    manifest: Dict[str, Any],
+    measurements: Dict[str, Any],
+    validation_config: Optional[Dict[str, Any]] = None,
+) -> bool:
     """
     Validate both inputs along the human/machine line
     (§spec:characterization-model): manifest checks against the
     show manifest, plausibility checks against the measurements
     artifact. Strict mode comes from the show manifest.
+
+    Batch callers can load the validation settings once and pass them
+    in; they are loaded from the settings file when omitted.
     """
-    validation_config = load_validation_settings()
+    if validation_config is None:
+        validation_config = load_validation_settings()
     strict_mode = manifest.get("validation", {}).get("strict_mode", False)
 
     if not validate_manifest_data(manifest, validation_config, strict_mode):
@@ -1540,12 +1662,11 @@ def _drive_to_display_reference_matrix(
     the compressor then moves are predicted from the config itself, not
     from this matrix.
     """
+    xyz_to_native = create_display_xyz_to_native_matrix(
+        characterization, chromatic_adaptation_transform
+    )
     return np.asarray(
-        np.linalg.inv(
-            _drive_space_matrix(characterization, chromatic_adaptation_transform)[
-                :3, :3
-            ]
-        ),
+        np.linalg.inv(_drive_space_matrix(characterization, xyz_to_native)),
         dtype=np.float64,
     )
 
@@ -1974,6 +2095,19 @@ def check_predictions(path: str) -> None:
     print(f"   ✓ '{predictions.config_file}' matches the recorded hash")
 
 
+def write_config(config: "OCIO.Config", path: str) -> None:
+    """
+    Write the serialized config to path as UTF-8 bytes, skipping
+    text-mode encoding. OCIO's serialize(fileName) overload is not used:
+    it drops write errors, and predictions hash whatever is on disk.
+
+    Raises:
+        OSError: When path cannot be written in full.
+    """
+    with open(path, "wb") as f:
+        f.write(config.serialize().encode("utf-8"))
+
+
 def generate_output_filename(
     manifest: Dict[str, Any], characterization: DisplayCharacterization
 ) -> str:
@@ -1990,8 +2124,20 @@ def generate_output_filename(
     return f"{display_name}_config.ocio"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_base_ocio(ocio_url: str) -> "OCIO.Config":
+    """Parse a base config once per URL. The cached config is never
+    handed out — callers mutate what they get, so they get copies."""
+    return OCIO.Config.CreateFromFile(ocio_url)
+
+
 def create_base_ocio_config(manifest: Dict[str, Any]) -> "OCIO.Config":
-    """Create base OCIO configuration using ocio:// scheme."""
+    """Create base OCIO configuration using ocio:// scheme.
+
+    Returns an independent copy of the cached parse: the bundled
+    ocio:// configs are large, and batch callers load the same one
+    repeatedly.
+    """
 
     base_config = manifest.get("ocio", {}).get("base_config", {})
     config_type = base_config.get("type", "studio")
@@ -2009,7 +2155,8 @@ def create_base_ocio_config(manifest: Dict[str, Any]) -> "OCIO.Config":
 
     try:
         # Load the base configuration using ocio:// scheme
-        ocio_config = OCIO.Config.CreateFromFile(ocio_url)
+        # The binding exposes Config::createEditableCopy as __deepcopy__.
+        ocio_config = copy.deepcopy(_load_base_ocio(ocio_url))
         print("✓ Successfully loaded base configuration")
         return ocio_config
 
@@ -2058,6 +2205,7 @@ def main():
         return
 
     print("=== OCIO Display Generator ===")
+    print(f"YAML parser: {YAML_BACKEND}")
     print(f"Loading manifest from '{SHOW_MANIFEST_FILE}'...")
     try:
         manifest, measurements, provenance = load_inputs(SHOW_MANIFEST_FILE)
@@ -2127,8 +2275,7 @@ def main():
             raise RuntimeError(
                 f"Generated config failed OCIO validation: {exc}"
             ) from exc
-        with open(output_config_path, "w", encoding="utf-8") as f:
-            f.write(ocio_config_obj.serialize())
+        write_config(ocio_config_obj, output_config_path)
         # Predictions bind to the config's bytes, so they are built from
         # the file just written (§spec:verification, §spec:provenance).
         predictions = build_predictions(
@@ -2188,6 +2335,5 @@ def main():
         sys.exit(1)
 
 
-# Example usage for single display characterization
 if __name__ == "__main__":
     main()
@@ -125,7 +125,10 @@ class Config:
     def getProcessor(
         self, srcColorSpaceName: str, display: str, view: str, direction: Any
     ) -> Processor: ...
+    @overload
     def serialize(self) -> str: ...
+    @overload
+    def serialize(self, fileName: str) -> None: ...
     def validate(self) -> None: ...
 
 # Constants
@@ -47,11 +47,7 @@ def make_characterization(
 ) -> DisplayCharacterization:
     """Characterization with the sample-yaml wall measurements."""
     char = DisplayCharacterization("Test Wall")
-    char.primaries = {
-        "red": tuple(WALL_PRIMARIES[0]),
-        "green": tuple(WALL_PRIMARIES[1]),
-        "blue": tuple(WALL_PRIMARIES[2]),
-    }
+    char.primaries = WALL_PRIMARIES.copy()
     char.white_point = white_point
     char.black_level = 0.005
     char.peak_luminance = PEAK_LUMINANCE
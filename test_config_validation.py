@@ -5,9 +5,11 @@ import hashlib
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
 import yaml  # type: ignore[import]
 
+import OCIODisplayGen
 from conftest import (
     GAMMA,
     PEAK_LUMINANCE,
@@ -16,10 +18,16 @@ from conftest import (
     WALL_WHITEPOINT,
 )
 from OCIODisplayGen import (
+    DEFAULT_VALIDATION_SETTINGS,
+    VALIDATION_SETTINGS_FILE,
     create_characterization,
     load_inputs,
+    load_validation_settings,
+    measured_contrast_ratio,
+    parse_yaml_mapping,
     resolve_measurements_pointer,
     validate_inputs,
+    white_point_cct_duv,
 )
 
 
@@ -111,6 +119,81 @@ def test_zero_black_level_characterization_has_infinite_contrast() -> None:
     assert char.contrast_ratio == float("inf")
 
 
+def test_primary_outside_xy_triangle_fails_strict(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    measurements = make_measurements_dict()
+    measurements["colorimetry"]["primaries"]["green"] = [0.4, 0.7]
+    assert not validate_inputs(make_manifest_dict(strict_mode=True), measurements)
+    assert "green primary (0.4, 0.7) is outside" in capsys.readouterr().out
+
+
+def test_primary_outside_xy_triangle_warns_non_strict(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    measurements = make_measurements_dict()
+    measurements["colorimetry"]["primaries"]["blue"] = [-0.01, 0.06]
+    assert validate_inputs(make_manifest_dict(), measurements)
+    out = capsys.readouterr().out
+    assert "blue primary (-0.01, 0.06) is outside" in out
+    assert "✓ red primary" in out and "✓ green primary" in out
+
+
+def test_validation_settings_parsed_once_and_edits_picked_up(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    settings_path = tmp_path / VALIDATION_SETTINGS_FILE
+    settings_path.write_text("min_contrast_ratio: 50\n", encoding="utf-8")
+    cache = OCIODisplayGen._load_validation_file
+    assert load_validation_settings()["min_contrast_ratio"] == 50
+    hits = cache.cache_info().hits
+    assert load_validation_settings()["min_contrast_ratio"] == 50
+    assert cache.cache_info().hits == hits + 1
+
+    settings_path.write_text("min_contrast_ratio: 2000\n", encoding="utf-8")
+    assert load_validation_settings()["min_contrast_ratio"] == 2000
+
+
+def test_preloaded_validation_settings_skip_the_settings_file(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def unread() -> dict[str, Any]:
+        raise AssertionError("validation settings file was read")
+
+    monkeypatch.setattr(OCIODisplayGen, "load_validation_settings", unread)
+    settings = {**DEFAULT_VALIDATION_SETTINGS, "min_contrast_ratio": 1e9}
+    assert not validate_inputs(
+        make_manifest_dict(strict_mode=True), make_measurements_dict(), settings
+    )
+    assert "Contrast ratio" in capsys.readouterr().out
+
+
+def test_white_point_cct_duv_broadcasts_over_batches() -> None:
+    white_points = np.array([WALL_WHITEPOINT, (0.3457, 0.3585), (0.28, 0.29)])
+    batch = white_point_cct_duv(white_points)
+    assert batch.shape == (3, 2)
+    for xy, row in zip(white_points, batch):
+        assert np.allclose(white_point_cct_duv(xy), row)
+    # D65: ~6504 K, just above the Planckian locus
+    assert batch[0, 0] == pytest.approx(6504, abs=1)
+    assert 0.0 < batch[0, 1] < 0.005
+
+
+def test_contrast_ratio_matches_between_validation_and_characterization(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # Out-of-range contrast is reported from the same value the
+    # characterization records.
+    measurements = make_measurements_dict(black_level=50.0)
+    assert validate_inputs(make_manifest_dict(), measurements)
+    char = create_characterization(make_manifest_dict(), measurements)
+    assert char.contrast_ratio == measured_contrast_ratio(PEAK_LUMINANCE, 50.0)
+    assert f"Contrast ratio {char.contrast_ratio:.0f}:1 outside" in (
+        capsys.readouterr().out
+    )
+
+
 def test_invalid_white_point_policy_fails_strict() -> None:
     manifest = make_manifest_dict(strict_mode=True)
     manifest["ocio"]["white_point_policy"] = "perceptual"
@@ -132,11 +215,9 @@ def test_shipped_samples_characterization_matches_sample_wall() -> None:
     manifest, measurements, _ = load_inputs(str(SAMPLE_MANIFEST_PATH))
     char = create_characterization(manifest, measurements)
     assert char.name == "ROE Black Pearl 2 (NS) (2018) + Brompton S8 (3.5.2)"
-    assert char.primaries == {
-        "red": tuple(WALL_PRIMARIES[0]),
-        "green": tuple(WALL_PRIMARIES[1]),
-        "blue": tuple(WALL_PRIMARIES[2]),
-    }
+    assert char.primaries.shape == (3, 2)
+    assert char.primaries.dtype == np.float64
+    assert np.array_equal(char.primaries, WALL_PRIMARIES)
     assert char.white_point == WALL_WHITEPOINT
     assert char.black_level == 0.005
     assert char.peak_luminance == PEAK_LUMINANCE
@@ -224,3 +305,11 @@ def test_artifact_path_resolved_relative_to_show_manifest_file(tmp_path: Path) -
     )
     _, measurements, _ = load_inputs(str(show_dir / "show_manifest.yaml"))
     assert measurements["luminance"]["peak_luminance"] == PEAK_LUMINANCE
+
+
+def test_yaml_loader_stays_safe() -> None:
+    # The C-backed loader is a speedup only: arbitrary Python object
+    # tags are still refused.
+    data = b"value: !!python/object/apply:os.getcwd []\n"
+    with pytest.raises(ValueError, match="not valid YAML"):
+        parse_yaml_mapping(data, "evil.yaml", "Show manifest")
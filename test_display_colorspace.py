@@ -19,7 +19,9 @@ from conftest import (
 from OCIODisplayGen import (
     D65_WHITE_XY,
     DISPLAY_REFERENCE,
+    REFERENCE_LUMINANCE,
     DisplayCharacterization,
+    _matrix_transform,
     create_characterization,
     create_display_colorspace_from_characterization,
     create_display_xyz_to_native_matrix,
@@ -132,7 +134,13 @@ def test_non_d65_wall_white_uses_cat02() -> None:
         colour.xy_to_XYZ(np.array(NON_D65_WALL_WHITE)),
         transform="CAT02",
     )
-    expected = non_d65_wall_space().matrix_XYZ_to_RGB @ cat
+    # GAMMA fuses the luminance scale (RGB 1.0 = measured peak) into
+    # the same matrix.
+    expected = (
+        (REFERENCE_LUMINANCE / PEAK_LUMINANCE)
+        * non_d65_wall_space().matrix_XYZ_to_RGB
+        @ cat
+    )
 
     assert np.allclose(emitted[:3, :3], expected, atol=1e-6)
     assert np.allclose(emitted[3], [0.0, 0.0, 0.0, 1.0])
@@ -146,7 +154,7 @@ def test_absolute_policy_matrix_has_no_cat() -> None:
         )
     )
     expected = non_d65_wall_space().matrix_XYZ_to_RGB
-    assert np.allclose(matrix[:3, :3], expected, atol=1e-6)
+    assert np.allclose(matrix, expected, atol=1e-6)
 
 
 def test_absolute_policy_reproduces_d65_chromaticity() -> None:
@@ -155,7 +163,7 @@ def test_absolute_policy_reproduces_d65_chromaticity() -> None:
             "GAMMA", white_point=NON_D65_WALL_WHITE, white_point_policy="absolute"
         )
     )
-    rgb = matrix[:3, :3] @ colour.xy_to_XYZ(np.array(D65_WHITE_XY))
+    rgb = matrix @ colour.xy_to_XYZ(np.array(D65_WHITE_XY))
     # No adaptation: D65 white lands off the wall's neutral axis.
     assert not np.allclose(rgb, [rgb[0]] * 3, atol=1e-4)
     # Colorimetrically exact: back through the wall's RGB→XYZ, the
@@ -276,3 +284,26 @@ def test_validation_missing_processor_state_strict_fails() -> None:
 
 def test_validation_missing_processor_state_non_strict_warns() -> None:
     assert validate_inputs(*inputs_without_processor_state(False)) is True
+
+
+def test_matrix_transform_pads_3x3_row_major_for_any_layout() -> None:
+    # The 3x3 block lands row-major in OCIO's 4x4 with alpha passed
+    # through, whatever the input's memory layout.
+    matrix = np.arange(1.0, 10.0).reshape(3, 3)
+    strided = np.arange(1.0, 19.0).reshape(3, 6)[:, ::2]
+    assert not strided.flags.c_contiguous
+    for layout in (matrix, np.asfortranarray(matrix), strided):
+        expected = np.identity(4)
+        expected[:3, :3] = layout
+        emitted = _matrix_transform(layout).getMatrix()
+        assert emitted == expected.ravel().tolist()
+
+
+@pytest.mark.parametrize("eotf_type", ["GAMMA", "PQ"])
+def test_colorspace_emits_a_single_matrix_op(eotf_type: str) -> None:
+    cs = create_display_colorspace_from_characterization(
+        make_characterization(eotf_type)
+    )
+    group = cs.getTransform(OCIO.COLORSPACE_DIR_FROM_REFERENCE)
+    matrices = [t for t in group if isinstance(t, OCIO.MatrixTransform)]
+    assert len(matrices) == 1
@@ -1,18 +1,26 @@
 #!/usr/bin/env python3
 """Tests for registering the wall as a named OCIO display."""
 
+from typing import Any
+
 import numpy as np
 import PyOpenColorIO as OCIO
 import pytest
 
+import OCIODisplayGen
 from conftest import (
     ACES2_STUDIO_CONFIG_URI,
     GAMMA,
     PEAK_LUMINANCE,
     build_reloaded_config,
     d65_xyz,
+    make_characterization,
+)
+from OCIODisplayGen import (
+    COLORIMETRIC_VIEW,
+    create_display_colorspace_from_characterization,
+    register_display,
 )
-from OCIODisplayGen import COLORIMETRIC_VIEW
 
 
 @pytest.fixture(scope="module")
@@ -68,3 +76,24 @@ def test_colorimetric_view_reproduces_display_code_values(
     expected = (100.0 / PEAK_LUMINANCE) ** (1.0 / GAMMA)
     out = cpu.applyRGB(list(d65_xyz(1.0)))
     assert np.allclose(out, [expected] * 3, atol=1e-4)
+
+
+def test_register_display_derives_policy_matrix_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Both views sandwich the same matrix; registration derives it once
+    # and hands it to each builder.
+    calls: list[tuple[Any, ...]] = []
+    derive = OCIODisplayGen.create_display_xyz_to_native_matrix
+
+    def counting(*args: Any, **kwargs: Any) -> Any:
+        calls.append(args)
+        return derive(*args, **kwargs)
+
+    monkeypatch.setattr(OCIODisplayGen, "create_display_xyz_to_native_matrix", counting)
+    config = OCIO.Config.CreateFromFile(ACES2_STUDIO_CONFIG_URI)
+    char = make_characterization()
+    cs = create_display_colorspace_from_characterization(char)
+    calls.clear()
+    register_display(config, cs, char)
+    assert len(calls) == 1
@@ -120,9 +120,7 @@ def wall_native_to_xyz_matrix(
     the generator: derived primaries matrix, then wall white → D65."""
     space = colour.RGB_Colourspace(
         char.name,
-        np.array(
-            [char.primaries["red"], char.primaries["green"], char.primaries["blue"]]
-        ),
+        char.primaries,
         np.asarray(char.white_point),
         "Wall White",
     )
@@ -20,6 +20,7 @@ from OCIODisplayGen import (
     load_inputs,
     record_provenance,
     register_display,
+    write_config,
 )
 
 REPO_DIR = SAMPLE_MANIFEST_PATH.parent
@@ -185,3 +186,26 @@ def test_consecutive_generations_are_byte_identical(tmp_path: Path) -> None:
     first = generate_config_text(manifest_path)
     second = generate_config_text(manifest_path)
     assert first == second
+
+
+def test_written_config_matches_serialized_text(tmp_path: Path) -> None:
+    config = OCIO.Config.CreateFromFile(ACES2_STUDIO_CONFIG_URI)
+    path = tmp_path / "wall_config.ocio"
+    path.write_text("stale", encoding="utf-8")
+    write_config(config, str(path))
+    assert path.read_bytes() == config.serialize().encode("utf-8")
+
+
+def test_unwritable_config_path_fails_loud(tmp_path: Path) -> None:
+    config = OCIO.Config.CreateFromFile(ACES2_STUDIO_CONFIG_URI)
+    with pytest.raises(OSError):
+        write_config(config, str(tmp_path / "missing_dir" / "wall_config.ocio"))
+
+
+@pytest.mark.skipif(not Path("/dev/full").exists(), reason="needs /dev/full")
+def test_short_config_write_fails_loud() -> None:
+    # A write that runs out of space must raise, never leave a
+    # truncated config behind for the predictions to hash.
+    config = OCIO.Config.CreateFromFile(ACES2_STUDIO_CONFIG_URI)
+    with pytest.raises(OSError):
+        write_config(config, "/dev/full")
@@ -60,6 +60,17 @@ def test_create_base_ocio_config_selects_aces2_studio() -> None:
     )
 
 
+def test_create_base_ocio_config_returns_independent_copies() -> None:
+    # The parse is cached per URL; mutating one result must not leak
+    # into the next.
+    manifest: dict[str, dict[str, dict[str, str]]] = {"ocio": {"base_config": {}}}
+    first = create_base_ocio_config(manifest)
+    first.setDescription("mutated")
+    second = create_base_ocio_config(manifest)
+    assert first is not second
+    assert second.getDescription() != "mutated"
+
+
 def test_both_studio_display_reference_names_known() -> None:
     # The 1.3 and 2.0 studio configs name the same space differently.
     assert DISPLAY_REFERENCE in KNOWN_DISPLAY_REFERENCES
@@ -83,7 +94,7 @@ def test_missing_interchange_roles_raise() -> None:
 
 
 def test_matrix_matches_colour_science_xyz_to_native() -> None:
-    matrix_4x4 = create_display_xyz_to_native_matrix(make_characterization())
+    matrix = create_display_xyz_to_native_matrix(make_characterization())
 
     wall = colour.RGB_Colourspace(
         "Wall", WALL_PRIMARIES, np.array(WALL_WHITEPOINT), "Wall White"
@@ -96,10 +107,18 @@ def test_matrix_matches_colour_science_xyz_to_native() -> None:
     )
     expected = wall.matrix_XYZ_to_RGB @ cat
 
-    assert matrix_4x4.shape == (4, 4)
-    assert np.allclose(matrix_4x4[:3, :3], expected, atol=1e-10)
-    assert np.allclose(matrix_4x4[3], [0.0, 0.0, 0.0, 1.0])
-    assert np.allclose(matrix_4x4[:3, 3], [0.0, 0.0, 0.0])
+    assert matrix.shape == (3, 3)
+    assert np.allclose(matrix, expected, atol=1e-10)
+
+
+def test_matrix_is_a_private_copy_of_the_cached_derivation() -> None:
+    # The derived XYZ→RGB solve is cached per wall; callers get their
+    # own copy, so mutating one cannot poison the next build.
+    char = make_characterization(white_point_policy="absolute")
+    first = create_display_xyz_to_native_matrix(char)
+    expected = first.copy()
+    first[:] = 0.0
+    assert np.array_equal(create_display_xyz_to_native_matrix(char), expected)
 
 
 def test_no_scene_referred_hardcode_remains() -> None:
@@ -110,7 +129,7 @@ def test_no_scene_referred_hardcode_remains() -> None:
 
     # The generated matrix is the XYZ-based computation — not an
     # RGB-to-RGB matrix from any scene reference space.
-    matrix_4x4 = create_display_xyz_to_native_matrix(make_characterization())
+    matrix = create_display_xyz_to_native_matrix(make_characterization())
     wall = colour.RGB_Colourspace(
         "Wall", WALL_PRIMARIES, np.array(WALL_WHITEPOINT), "Wall White"
     )
@@ -119,4 +138,4 @@ def test_no_scene_referred_hardcode_remains() -> None:
         rgb_to_rgb = colour.matrix_RGB_to_RGB(
             colour.RGB_COLOURSPACES[scene_space], wall
         )
-        assert not np.allclose(matrix_4x4[:3, :3], rgb_to_rgb, atol=1e-3)
+        assert not np.allclose(matrix, rgb_to_rgb, atol=1e-3)
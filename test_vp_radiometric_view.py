@@ -162,7 +162,7 @@ def test_in_gamut_core_matches_matrix_only_reference(clamp_setup: Setup) -> None
     ap0_to_xyz = cfg.getProcessor(
         OCIO.BuiltinTransform(AP0_TO_XYZ_D65_BUILTIN)
     ).getDefaultCPUProcessor()
-    xyz_to_native = create_display_xyz_to_native_matrix(char)[:3, :3]
+    xyz_to_native = create_display_xyz_to_native_matrix(char)
     for scene in CORE_SCENE_VALUES:
         xyz = np.array(ap0_to_xyz.applyRGB(list(scene)))
         xyz *= NITS_ANCHOR / REFERENCE_LUMINANCE
@@ -214,7 +214,7 @@ def test_sweep_is_beyond_wall_gamut(clamp_setup: Setup) -> None:
     ap0_to_xyz = cfg.getProcessor(
         OCIO.BuiltinTransform(AP0_TO_XYZ_D65_BUILTIN)
     ).getDefaultCPUProcessor()
-    xyz_to_native = create_display_xyz_to_native_matrix(char)[:3, :3]
+    xyz_to_native = create_display_xyz_to_native_matrix(char)
     outside = 0
     sweep = hue_sweep_scenes()
     for scene in sweep: